@@ -12,16 +12,29 @@ ClickAttributeEditor
 
 import os
 import math
-
-from qgis.PyQt.QtCore import Qt
-from qgis.PyQt.QtGui import QAction, QIcon, QCursor
-from qgis.PyQt.QtWidgets import QInputDialog, QMessageBox
+import weakref
+
+from qgis.PyQt.QtCore import Qt, QLocale, QTimer
+from qgis.PyQt.QtGui import QAction, QIcon, QCursor, QDoubleValidator
+from qgis.PyQt.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QInputDialog,
+    QLabel,
+    QLineEdit,
+    QMessageBox,
+    QVBoxLayout,
+)
 
 from qgis.core import (
     NULL,
+    QgsCoordinateTransform,
     QgsFeatureRequest,
+    QgsField,
     QgsGeometry,
     QgsPointXY,
+    QgsProject,
+    QgsRectangle,
     QgsVectorLayer,
     QgsWkbTypes,
 )
@@ -32,10 +45,12 @@ from qgis.gui import QgsMapToolIdentify, QgsRubberBand
 # ========= CONFIG =========
 AUTO_START_EDITING = True
 AUTO_COMMIT = False
+AUTO_COMMIT_DELAY_MS = 750
 
 WINDOW_TITLE = "Edit attribute"
 SEARCH_RADIUS_PX = 12
 DRAG_THRESHOLD_PX = 6
+SAME_FEATURE_TOLERANCE_PX = 3
 
 ICON_FILENAME = "icon.png"
 BULK_MIN_POINTS = 3
@@ -56,6 +71,7 @@ def _qt_enum(group_name, enum_name, old_name):
 
 CROSS_CURSOR = _qt_enum("CursorShape", "CrossCursor", "CrossCursor")
 SHIFT_MODIFIER = _qt_enum("KeyboardModifier", "ShiftModifier", "ShiftModifier")
+CTRL_MODIFIER = _qt_enum("KeyboardModifier", "ControlModifier", "ControlModifier")
 LEFT_BUTTON = _qt_enum("MouseButton", "LeftButton", "LeftButton")
 RIGHT_BUTTON = _qt_enum("MouseButton", "RightButton", "RightButton")
 
@@ -75,21 +91,201 @@ def _polygon_geometry_type():
 POLYGON_GEOMETRY = _polygon_geometry_type()
 
 
-def _is_numeric_field(field) -> bool:
+def _feature_request_flags():
+    """
+    Compatibility helper for QgsFeatureRequest flag locations.
+
+    Returns NoGeometry | ExactIntersect, or None if neither the QGIS 3
+    nor the QGIS 4 enum location is available.
+    """
+    flag_group = getattr(QgsFeatureRequest, "Flag", None)
+
+    if flag_group is not None and hasattr(flag_group, "NoGeometry"):
+        return flag_group.NoGeometry | flag_group.ExactIntersect
+
+    if hasattr(QgsFeatureRequest, "NoGeometry"):
+        return QgsFeatureRequest.NoGeometry | QgsFeatureRequest.ExactIntersect
+
     try:
-        return field.isNumeric()
+        from qgis.core import Qgis
+
+        return (
+            Qgis.FeatureRequestFlag.NoGeometry
+            | Qgis.FeatureRequestFlag.ExactIntersect
+        )
     except Exception:
-        return False
+        return None
+
+
+FEATURE_REQUEST_FLAGS = _feature_request_flags()
+
+
+# Warning texts built once at import time, so the miss paths do not pay
+# string construction per click.
+MSG_NO_VALID_LAYER = "Please activate a valid vector layer."
+MSG_NOT_VECTOR_LAYER = "The active layer must be a vector layer."
+MSG_CANNOT_START_EDITING = "Could not start editing on the active layer."
+MSG_NOT_IN_EDIT_MODE = "The layer is not in edit mode."
+
+
+def _dialog_accepted_code():
+    """
+    Compatibility helper for QDialog accepted code in Qt5 / Qt6.
+    """
+    code_group = getattr(QDialog, "DialogCode", None)
+
+    if code_group is not None and hasattr(code_group, "Accepted"):
+        return code_group.Accepted
+
+    return QDialog.Accepted
+
+
+def _standard_ok_cancel():
+    """
+    Compatibility helper for QDialogButtonBox standard buttons.
+    """
+    buttons = getattr(QDialogButtonBox, "StandardButton", QDialogButtonBox)
+
+    return buttons.Ok | buttons.Cancel
+
+
+DIALOG_ACCEPTED = _dialog_accepted_code()
+
+
+class _ValueDialog(QDialog):
+    """
+    Persistent value-entry dialog reused across clicks.
+
+    QInputDialog.getDouble/getText builds a fresh widget tree on every
+    invocation; this dialog is constructed once and only its label and
+    line edit are updated per click.
+    """
+
+    def __init__(self, parent=None, numeric=False):
+        super().__init__(parent)
+
+        self.setWindowTitle(WINDOW_TITLE)
+
+        self.numeric = numeric
+
+        self.label = QLabel(self)
+        self.line = QLineEdit(self)
+
+        buttons = QDialogButtonBox(_standard_ok_cancel(), self)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        button_group = getattr(
+            QDialogButtonBox, "StandardButton", QDialogButtonBox
+        )
+        self.ok_button = buttons.button(button_group.Ok)
+
+        if numeric:
+            self.line.setValidator(
+                QDoubleValidator(-1e18, 1e18, 6, self.line)
+            )
+            # QDoubleValidator reports Intermediate for "", "-" or
+            # "1e"; keep OK disabled until the input is Acceptable,
+            # like QInputDialog.getDouble does.
+            self.line.textChanged.connect(self._update_ok_enabled)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.label)
+        layout.addWidget(self.line)
+        layout.addWidget(buttons)
+
+    def _update_ok_enabled(self):
+        if self.ok_button is not None:
+            self.ok_button.setEnabled(self.line.hasAcceptableInput())
+
+    def accept(self):
+        # Guard against accept paths that bypass the OK button.
+        if self.numeric and not self.line.hasAcceptableInput():
+            return
+
+        super().accept()
+
+    def _exec(self):
+        if hasattr(self, "exec"):
+            return self.exec()
+
+        return self.exec_()
+
+    def ask(self, label_text, start_text):
+        """
+        Show the dialog and return (value, ok).
+
+        Numeric dialogs return a float parsed with the same locale the
+        validator accepts; text dialogs return the raw text.
+        """
+        self.label.setText(label_text)
+        self.line.setText(start_text)
+        self.line.selectAll()
+        self.line.setFocus()
+
+        if self._exec() != DIALOG_ACCEPTED:
+            return None, False
+
+        text = self.line.text()
+
+        if self.numeric:
+            # The validator is locale-aware ("1,5"), the downstream
+            # QVariant string-to-double conversion is not; normalize
+            # here.
+            value, ok = QLocale().toDouble(text)
+
+            if not ok:
+                return None, False
+
+            return value, True
+
+        return text, True
+
 
+def _bind_numeric_check():
+    """
+    Bind the numeric-field check once at import time.
+
+    Probing hasattr per call (or catching AttributeError per call) adds
+    avoidable overhead on the click hot path; the QgsField API does not
+    change at runtime, so decide once here.
+    """
+    if hasattr(QgsField, "isNumeric"):
+        return lambda field: bool(field.isNumeric())
+
+    return lambda field: False
+
+
+_is_numeric_field = _bind_numeric_check()
+
+
+def _numeric_start_value(field_def, value) -> float:
+    """
+    Initial dialog value for a numeric field.
 
-def _to_float_or_default(value, default=0.0) -> float:
+    Coerces the stored value once on the C++ side via
+    QgsField.convertCompatible instead of Python-level type juggling.
+    """
     if value in (None, NULL, ""):
-        return float(default)
+        return 0.0
+
+    try:
+        converted = field_def.convertCompatible(value)
+
+        # Depending on the bindings, convertCompatible returns either
+        # the converted value or an (ok, value) tuple.
+        if isinstance(converted, tuple):
+            converted = converted[-1]
+
+        if converted is not None:
+            value = converted
+    except Exception:
+        pass
 
     try:
         return float(value)
     except Exception:
-        return float(default)
+        return 0.0
 
 
 def _is_vector_layer(layer) -> bool:
@@ -103,40 +299,84 @@ def _is_vector_layer(layer) -> bool:
         return False
 
 
-def _event_pixel_xy(event):
+def _bind_pixel_xy_reader(event):
     """
-    Return mouse event pixel coordinates in a QGIS 3 / QGIS 4 safe way.
+    Pick the pixel-coordinate accessor once, from the first event seen.
+
+    The map-tool event API does not change at runtime, so the hasattr
+    probing chain only needs to run once instead of on every event.
     """
     if hasattr(event, "pixelPoint"):
-        point = event.pixelPoint()
-        return int(point.x()), int(point.y())
+        def _read(event):
+            point = event.pixelPoint()
+            return int(point.x()), int(point.y())
+
+        return _read
 
     if hasattr(event, "originalPixelPoint"):
-        point = event.originalPixelPoint()
-        return int(point.x()), int(point.y())
+        def _read(event):
+            point = event.originalPixelPoint()
+            return int(point.x()), int(point.y())
+
+        return _read
 
     if hasattr(event, "pos"):
-        point = event.pos()
-        return int(point.x()), int(point.y())
+        def _read(event):
+            point = event.pos()
+            return int(point.x()), int(point.y())
 
-    return int(event.x()), int(event.y())
+        return _read
 
+    def _read(event):
+        return int(event.x()), int(event.y())
 
-def _event_map_point(event, canvas):
+    return _read
+
+
+def _bind_map_point_reader(event):
     """
-    Return mouse event map coordinates as QgsPointXY.
+    Pick the map-coordinate accessor once, from the first event seen.
     """
     if hasattr(event, "mapPoint"):
-        point = event.mapPoint()
-        return QgsPointXY(point)
+        return lambda event, canvas: QgsPointXY(event.mapPoint())
 
     if hasattr(event, "originalMapPoint"):
-        point = event.originalMapPoint()
+        return lambda event, canvas: QgsPointXY(event.originalMapPoint())
+
+    def _read(event, canvas):
+        x, y = _event_pixel_xy(event)
+        point = canvas.getCoordinateTransform().toMapCoordinates(x, y)
         return QgsPointXY(point)
 
-    x, y = _event_pixel_xy(event)
-    point = canvas.getCoordinateTransform().toMapCoordinates(x, y)
-    return QgsPointXY(point)
+    return _read
+
+
+_PIXEL_XY_READER = None
+_MAP_POINT_READER = None
+
+
+def _event_pixel_xy(event):
+    """
+    Return mouse event pixel coordinates in a QGIS 3 / QGIS 4 safe way.
+    """
+    global _PIXEL_XY_READER
+
+    if _PIXEL_XY_READER is None:
+        _PIXEL_XY_READER = _bind_pixel_xy_reader(event)
+
+    return _PIXEL_XY_READER(event)
+
+
+def _event_map_point(event, canvas):
+    """
+    Return mouse event map coordinates as QgsPointXY.
+    """
+    global _MAP_POINT_READER
+
+    if _MAP_POINT_READER is None:
+        _MAP_POINT_READER = _bind_map_point_reader(event)
+
+    return _MAP_POINT_READER(event, canvas)
 
 
 def _event_is_shift_right_click(event) -> bool:
@@ -153,29 +393,18 @@ def _event_is_shift_right_click(event) -> bool:
     return is_shift and is_right_click
 
 
-def _event_is_left_button(event) -> bool:
+def _event_is_ctrl_modifier(event) -> bool:
     try:
-        return event.button() == LEFT_BUTTON
+        return bool(event.modifiers() & CTRL_MODIFIER)
     except Exception:
         return False
 
 
-def _get_first_identified_feature(result):
-    """
-    Extract QgsFeature from QgsMapToolIdentify.IdentifyResult.
-    """
-    if hasattr(result, "mFeature"):
-        return result.mFeature
-
-    if hasattr(result, "feature"):
-        feature_attr = result.feature
-
-        if callable(feature_attr):
-            return feature_attr()
-
-        return feature_attr
-
-    return None
+def _event_is_left_button(event) -> bool:
+    try:
+        return event.button() == LEFT_BUTTON
+    except Exception:
+        return False
 
 
 def _feature_geometry(feature):
@@ -199,6 +428,12 @@ class ClickEditTool(QgsMapToolIdentify):
     - click + drag = freehand bulk update
     """
 
+    # Whether triggerRepaint accepts an extent argument; None until the
+    # first targeted repaint attempt probes it. sip-bound methods expose
+    # no signature to inspect, so the probe has to be a real call —
+    # unsupported builds pay one swallowed TypeError in total.
+    _repaint_rect_supported = None
+
     def __init__(self, iface, plugin):
         super().__init__(iface.mapCanvas())
 
@@ -214,27 +449,64 @@ class ClickEditTool(QgsMapToolIdentify):
         self.bulk_points = []
         self.rubber_band = None
 
+        # CTRL-click "sticky value" mode: the last entered value is
+        # re-applied without prompting and the edits are accumulated
+        # for a single batched provider write on deactivation.
+        self._sticky_value = None
+        self._pending_edits = {}
+        self._pending_layer = None
+
+        # Canvas-to-layer CRS transform, cached per CRS pair: PROJ
+        # pipeline construction is too expensive to repeat per click.
+        self._xform = None
+        self._xform_key = None
+
+        # Last successful hit as (layer id, fid, pixel x, pixel y);
+        # repeat clicks nearby skip the spatial-index query.
+        self._last_hit = None
+
+        try:
+            iface.mapCanvas().destinationCrsChanged.connect(
+                self._invalidate_transform
+            )
+        except Exception:
+            pass
+
+        try:
+            iface.mapCanvas().extentsChanged.connect(
+                self._invalidate_last_hit
+            )
+        except Exception:
+            pass
+
+        self._push_warning = None
+
         self.setCursor(QCursor(CROSS_CURSOR))
 
     # --------------------------
     # General helpers
     # --------------------------
 
-    def _active_vector_layer_or_warn(self):
-        layer = self.iface.activeLayer()
+    def _warn(self, text):
+        """
+        Push a warning via a cached bound method.
 
-        if layer is None or not layer.isValid():
-            self.iface.messageBar().pushWarning(
-                "ClickAttributeEditor",
-                "Please activate a valid vector layer.",
-            )
-            return None
+        Resolving iface.messageBar().pushWarning is done once, not on
+        every miss.
+        """
+        if self._push_warning is None:
+            try:
+                self._push_warning = self.iface.messageBar().pushWarning
+            except Exception:
+                return
 
-        if not _is_vector_layer(layer):
-            self.iface.messageBar().pushWarning(
-                "ClickAttributeEditor",
-                "The active layer must be a vector layer.",
-            )
+        self._push_warning("ClickAttributeEditor", text)
+
+    def _active_vector_layer_or_warn(self):
+        layer = self.plugin.active_vector_layer()
+
+        if layer is None:
+            self._warn(self.plugin.active_layer_warning())
             return None
 
         return layer
@@ -247,16 +519,10 @@ class ClickEditTool(QgsMapToolIdentify):
             if layer.startEditing():
                 return True
 
-            self.iface.messageBar().pushWarning(
-                "ClickAttributeEditor",
-                "Could not start editing on the active layer.",
-            )
+            self._warn(MSG_CANNOT_START_EDITING)
             return False
 
-        self.iface.messageBar().pushWarning(
-            "ClickAttributeEditor",
-            "The layer is not in edit mode.",
-        )
+        self._warn(MSG_NOT_IN_EDIT_MODE)
         return False
 
     def _target_field_index_or_warn(self, layer):
@@ -264,56 +530,113 @@ class ClickEditTool(QgsMapToolIdentify):
             if not self.plugin.choose_field(layer):
                 return -1
 
-        idx = layer.fields().indexFromName(self.plugin.target_field)
+        idx = self.plugin.field_index(layer, self.plugin.target_field)
 
         if idx < 0:
-            self.iface.messageBar().pushWarning(
-                "ClickAttributeEditor",
-                f"Field '{self.plugin.target_field}' does not exist in the active layer.",
+            self._warn(
+                f"Field '{self.plugin.target_field}' does not exist in the active layer."
             )
             return -1
 
         return idx
 
     def _ask_new_value(self, layer, idx, current_value=None, label_suffix=""):
-        field_def = layer.fields()[idx]
-
         label = self.plugin.target_field
 
         if label_suffix:
             label = f"{label} {label_suffix}"
 
-        if _is_numeric_field(field_def):
-            start_value = _to_float_or_default(current_value, default=0.0)
-
-            new_value, ok = QInputDialog.getDouble(
-                self.iface.mainWindow(),
-                WINDOW_TITLE,
+        if self.plugin.field_is_numeric(layer, self.plugin.target_field):
+            field_def = self.plugin.field_def(layer, self.plugin.target_field)
+            start_value = _numeric_start_value(field_def, current_value)
+
+            # Seed with the same locale the validator and the
+            # QLocale().toDouble parse in ask() accept; str() would use
+            # a C-locale dot and leave OK disabled in comma-decimal
+            # locales. The dialog returns a locale-normalized float;
+            # layer.changeAttributeValue converts it to the field type
+            # on the C++ side.
+            value, ok = self.plugin.value_dialog(numeric=True).ask(
                 label,
-                start_value,
-                -1e18,
-                1e18,
-                6,
+                QLocale().toString(float(start_value), "f", 6),
             )
 
             if not ok:
                 return None, False
 
-            return new_value, True
+            return value, True
 
-        new_value, ok = QInputDialog.getText(
-            self.iface.mainWindow(),
-            WINDOW_TITLE,
+        text, ok = self.plugin.value_dialog(numeric=False).ask(
             label,
-            text="" if current_value in (None, NULL) else str(current_value),
+            "" if current_value in (None, NULL) else str(current_value),
         )
 
         if not ok:
             return None, False
 
-        return new_value, True
+        return text, True
+
+    def _repaint_rect_possible(self):
+        """
+        True while the extent overload is supported or still unprobed.
+        """
+        return ClickEditTool._repaint_rect_supported is not False
+
+    def _repaint_layer(self, layer, rect=None):
+        """
+        Repaint the layer, restricted to rect where supported.
+
+        QgsMapLayer.triggerRepaint only takes an extent on some builds;
+        the first targeted attempt settles _repaint_rect_supported and
+        mainline builds fall back to a plain full-layer repaint.
+        """
+        if (
+            rect is not None
+            and not rect.isEmpty()
+            and self._repaint_rect_possible()
+        ):
+            try:
+                layer.triggerRepaint(rect, True)
+                ClickEditTool._repaint_rect_supported = True
+                return
+            except TypeError:
+                ClickEditTool._repaint_rect_supported = False
+            except Exception:
+                pass
+
+        layer.triggerRepaint()
+
+    def _feature_bounding_box(self, layer, fid):
+        """
+        Fetch just the geometry of one feature for a targeted repaint.
+        """
+        request = QgsFeatureRequest()
+        request.setFilterFid(fid)
+        request.setSubsetOfAttributes([])
+
+        try:
+            feature = next(layer.getFeatures(request), None)
+        except Exception:
+            return None
+
+        if feature is None:
+            return None
+
+        geometry = _feature_geometry(feature)
 
-    def _apply_value_to_features(self, layer, idx, feature_ids, new_value):
+        if geometry is None:
+            return None
+
+        return geometry.boundingBox()
+
+    def _apply_value_to_features(
+        self,
+        layer,
+        idx,
+        feature_ids,
+        new_value,
+        repaint_rect=None,
+    ):
         if not feature_ids:
             return 0, 0
 
@@ -336,23 +659,64 @@ class ClickEditTool(QgsMapToolIdentify):
         except Exception:
             pass
 
-        layer.triggerRepaint()
+        self._repaint_layer(layer, repaint_rect)
 
         if AUTO_COMMIT:
-            if not layer.commitChanges():
-                layer.rollBack()
+            self.plugin.schedule_commit(layer)
 
-                QMessageBox.warning(
-                    self.iface.mainWindow(),
-                    "ClickAttributeEditor",
-                    "Commit failed. Changes were rolled back.",
-                )
+        return updated, failed
 
-                return updated, failed
+    def _flush_pending_edits(self):
+        """
+        Apply accumulated sticky-value edits in one edit command.
+
+        The edits go through the layer's edit buffer like every other
+        edit in this plugin, so they stay undoable and uncommitted
+        until the user (or AUTO_COMMIT) saves. Writing through
+        dataProvider() would bypass the buffer, make the edits
+        permanent immediately and expect provider field indices, which
+        differ from layer indices when joined or virtual fields exist.
+        """
+        if not self._pending_edits:
+            return
 
-            layer.startEditing()
+        edits = self._pending_edits
+        self._pending_edits = {}
 
-        return updated, failed
+        layer_ref = self._pending_layer
+        self._pending_layer = None
+
+        layer = layer_ref() if layer_ref is not None else None
+
+        if layer is None or not layer.isValid():
+            return
+
+        if not self._ensure_editing(layer):
+            return
+
+        try:
+            layer.beginEditCommand("ClickAttributeEditor batch update")
+        except Exception:
+            pass
+
+        for fid, attributes in edits.items():
+            for idx, value in attributes.items():
+                layer.changeAttributeValue(fid, idx, value)
+
+        try:
+            layer.endEditCommand()
+        except Exception:
+            pass
+
+        layer.triggerRepaint()
+
+        if AUTO_COMMIT:
+            self.plugin.schedule_commit(layer)
+
+        self.iface.messageBar().pushInfo(
+            "ClickAttributeEditor",
+            f"Sticky value applied to {len(edits)} feature(s).",
+        )
 
     def _reset_interaction(self):
         self.left_press_active = False
@@ -373,53 +737,154 @@ class ClickEditTool(QgsMapToolIdentify):
     # Point update
     # --------------------------
 
-    def _identify_hits(self, event, layer):
-        x, y = _event_pixel_xy(event)
+    def _invalidate_transform(self):
+        self._xform = None
+        self._xform_key = None
 
+    def _layer_transform(self, canvas, layer):
+        """
+        Return the cached canvas-to-layer CRS transform, or None.
+
+        Rebuilt only when the CRS pair changes; otherwise a click pays
+        a tuple compare instead of a PROJ pipeline construction.
+        """
+        try:
+            destination_crs = canvas.mapSettings().destinationCrs()
+            layer_crs = layer.crs()
+
+            # authid() is empty for custom/user CRSes, which would make
+            # all of them share one cache slot; fall back to the WKT.
+            key = (
+                destination_crs.authid() or destination_crs.toWkt(),
+                layer_crs.authid() or layer_crs.toWkt(),
+            )
+        except Exception:
+            return None
+
+        if key != self._xform_key:
+            try:
+                self._xform = QgsCoordinateTransform(
+                    destination_crs,
+                    layer.crs(),
+                    QgsProject.instance(),
+                )
+            except Exception:
+                self._xform = None
+
+            self._xform_key = key
+
+        return self._xform
+
+    def _invalidate_last_hit(self):
+        self._last_hit = None
+
+    def _search_rect_layer_crs(self, x, y, layer):
+        """
+        Build a small search rectangle around the click, in layer CRS.
+        """
         canvas = self.iface.mapCanvas()
-        search_radius_map_units = SEARCH_RADIUS_PX * canvas.mapUnitsPerPixel()
 
-        properties_applied = False
+        center = canvas.getCoordinateTransform().toMapCoordinates(x, y)
+
+        radius = SEARCH_RADIUS_PX * canvas.mapUnitsPerPixel()
+
+        rect = QgsRectangle(
+            center.x() - radius,
+            center.y() - radius,
+            center.x() + radius,
+            center.y() + radius,
+        )
+
+        transform = self._layer_transform(canvas, layer)
+
+        if transform is not None:
+            try:
+                if transform.isValid():
+                    rect = transform.transformBoundingBox(rect)
+            except Exception:
+                pass
+
+        return rect
+
+    def _cached_fid_feature(self, layer, idx, x, y):
+        """
+        Fast path for repeat clicks on the same spot.
+
+        Reuses the last hit's feature id via a direct FilterFid lookup,
+        which skips the spatial-index traversal entirely.
+        """
+        last = self._last_hit
+
+        if last is None:
+            return None
+
+        layer_id, fid, last_x, last_y = last
+
+        if (
+            layer_id != id(layer)
+            or abs(x - last_x) > SAME_FEATURE_TOLERANCE_PX
+            or abs(y - last_y) > SAME_FEATURE_TOLERANCE_PX
+        ):
+            return None
+
+        request = QgsFeatureRequest()
+        request.setFilterFid(fid)
+        request.setSubsetOfAttributes([idx])
+
+        if FEATURE_REQUEST_FLAGS is not None:
+            try:
+                request.setFlags(FEATURE_REQUEST_FLAGS)
+            except Exception:
+                pass
 
         try:
-            if hasattr(QgsMapToolIdentify, "IdentifyProperties") and hasattr(
-                self, "setPropertiesOverrides"
-            ):
-                properties = QgsMapToolIdentify.IdentifyProperties()
-                properties.searchRadiusMapUnits = search_radius_map_units
-                self.setPropertiesOverrides(properties)
-                properties_applied = True
-
-            elif hasattr(self, "setCanvasPropertiesOverrides"):
-                self.setCanvasPropertiesOverrides(search_radius_map_units)
-                properties_applied = True
+            feature = next(layer.getFeatures(request), None)
+        except Exception:
+            return None
+
+        if feature is None or not feature.isValid():
+            return None
+
+        return feature
 
+    def _feature_at_event(self, event, layer, idx):
+        """
+        Find the topmost feature under the cursor.
+
+        Uses a rectangle-filtered feature request so the provider's
+        spatial index prunes candidates, instead of the much slower
+        QgsMapToolIdentify scan. Only the target attribute is
+        materialized; geometry is not fetched at all.
+        """
+        x, y = _event_pixel_xy(event)
+
+        feature = self._cached_fid_feature(layer, idx, x, y)
+
+        if feature is not None:
+            return feature
+
+        rect = self._search_rect_layer_crs(x, y, layer)
+
+        request = QgsFeatureRequest()
+        request.setFilterRect(rect)
+        request.setLimit(1)
+        request.setSubsetOfAttributes([idx])
+
+        if FEATURE_REQUEST_FLAGS is not None:
             try:
-                return self.identify(
-                    x,
-                    y,
-                    [layer],
-                    QgsMapToolIdentify.TopDownStopAtFirst,
-                )
+                request.setFlags(FEATURE_REQUEST_FLAGS)
+            except Exception:
+                pass
 
-            except TypeError:
-                return self.identify(
-                    x,
-                    y,
-                    QgsMapToolIdentify.TopDownStopAtFirst,
-                    [layer],
-                    QgsMapToolIdentify.VectorLayer,
-                )
+        try:
+            feature = next(layer.getFeatures(request), None)
+        except Exception:
+            return None
 
-        finally:
-            if properties_applied:
-                try:
-                    if hasattr(self, "restorePropertiesOverrides"):
-                        self.restorePropertiesOverrides()
-                    elif hasattr(self, "restoreCanvasPropertiesOverrides"):
-                        self.restoreCanvasPropertiesOverrides()
-                except Exception:
-                    pass
+        if feature is not None and feature.isValid():
+            self._last_hit = (id(layer), feature.id(), x, y)
+
+        return feature
 
     def _handle_point_update(self, event):
         layer = self._active_vector_layer_or_warn()
@@ -432,30 +897,34 @@ class ClickEditTool(QgsMapToolIdentify):
         if idx < 0:
             return
 
-        try:
-            hits = self._identify_hits(event, layer)
-        except Exception as exc:
-            QMessageBox.warning(
-                self.iface.mainWindow(),
-                "ClickAttributeEditor",
-                f"Feature identification failed:\n\n{exc}",
-            )
-            return
+        feature = self._feature_at_event(event, layer, idx)
 
         # Requested behavior:
         # if no feature was clicked, do nothing silently.
-        if not hits:
+        if feature is None or not feature.isValid():
             return
 
-        feature = _get_first_identified_feature(hits[0])
+        if self._sticky_value is not None and _event_is_ctrl_modifier(event):
+            # Pending edits carry another layer's fids and field index;
+            # flush them before accumulating against this layer.
+            if self._pending_edits:
+                pending_layer = (
+                    self._pending_layer()
+                    if self._pending_layer is not None
+                    else None
+                )
+
+                if pending_layer is not layer:
+                    self._flush_pending_edits()
 
-        if feature is None or not feature.isValid():
+            self._pending_edits[feature.id()] = {idx: self._sticky_value}
+            self._pending_layer = weakref.ref(layer)
             return
 
         if not self._ensure_editing(layer):
             return
 
-        current_value = feature[self.plugin.target_field]
+        current_value = feature.attribute(idx)
 
         new_value, ok = self._ask_new_value(
             layer,
@@ -467,11 +936,20 @@ class ClickEditTool(QgsMapToolIdentify):
         if not ok:
             return
 
+        # Only fetch the geometry for a targeted repaint while the
+        # extent overload may exist; the box would be discarded
+        # otherwise.
+        repaint_rect = None
+
+        if self._repaint_rect_possible():
+            repaint_rect = self._feature_bounding_box(layer, feature.id())
+
         updated, failed = self._apply_value_to_features(
             layer,
             idx,
             [feature.id()],
             new_value,
+            repaint_rect=repaint_rect,
         )
 
         if failed:
@@ -480,6 +958,9 @@ class ClickEditTool(QgsMapToolIdentify):
                 "ClickAttributeEditor",
                 "Failed to update attribute value.",
             )
+            return
+
+        self._sticky_value = new_value
 
     # --------------------------
     # Freehand bulk update
@@ -535,7 +1016,14 @@ class ClickEditTool(QgsMapToolIdentify):
         return geometry
 
     def _feature_ids_intersecting_geometry(self, layer, selection_geometry):
+        """
+        Return (feature ids, combined bounding box) of intersecting
+        features; the box is used for a targeted repaint afterwards and
+        stays None where triggerRepaint cannot take an extent.
+        """
         feature_ids = []
+        combined_box = None
+        want_box = self._repaint_rect_possible()
 
         request = QgsFeatureRequest()
         request.setFilterRect(selection_geometry.boundingBox())
@@ -549,10 +1037,20 @@ class ClickEditTool(QgsMapToolIdentify):
             try:
                 if selection_geometry.intersects(geometry):
                     feature_ids.append(feature.id())
+
+                    if not want_box:
+                        continue
+
+                    if combined_box is None:
+                        combined_box = QgsRectangle(geometry.boundingBox())
+                    else:
+                        combined_box.combineExtentWith(
+                            geometry.boundingBox()
+                        )
             except Exception:
                 continue
 
-        return feature_ids
+        return feature_ids, combined_box
 
     def _handle_bulk_update(self):
         layer = self._active_vector_layer_or_warn()
@@ -570,7 +1068,7 @@ class ClickEditTool(QgsMapToolIdentify):
         if idx < 0:
             return
 
-        feature_ids = self._feature_ids_intersecting_geometry(
+        feature_ids, combined_box = self._feature_ids_intersecting_geometry(
             layer,
             selection_geometry,
         )
@@ -597,6 +1095,7 @@ class ClickEditTool(QgsMapToolIdentify):
             idx,
             feature_ids,
             new_value,
+            repaint_rect=combined_box,
         )
 
         if failed:
@@ -712,6 +1211,10 @@ class ClickEditTool(QgsMapToolIdentify):
             self._reset_interaction()
 
     def deactivate(self):
+        self._flush_pending_edits()
+        self._sticky_value = None
+        self._last_hit = None
+
         self._reset_interaction()
         super().deactivate()
 
@@ -729,6 +1232,36 @@ class ClickAttributeEditor:
 
         self.icon = QIcon()
 
+        self._num_dialog = None
+        self._txt_dialog = None
+
+        self._commit_timer = None
+        self._pending_commit_layer = None
+
+        self._suppress_toggle = False
+
+        # Active-layer state, revalidated once per layer switch instead
+        # of per click.
+        self._active_ok = False
+        self._active_layer = None
+        self._active_warn = MSG_NO_VALID_LAYER
+
+        # (id(layer), field name) -> (field count, field index).
+        # The field count acts as a cheap version proxy so a stale
+        # index is never reused after a schema change.
+        self._field_cache = {}
+
+        # Layers whose updatedFields signal is already connected,
+        # tracked by layer.id() string: unlike id(layer), those are
+        # never reused within a session, so the skip below can never
+        # leave a new layer unwatched.
+        self._field_cache_layer_ids = set()
+
+        # (id(layer), field count) -> list of field names, shared by
+        # choose_field so repeat field switches skip the full
+        # layer.fields() iteration.
+        self._field_names_cache = {}
+
     # --------------------------
     # GUI helpers
     # --------------------------
@@ -737,9 +1270,35 @@ class ClickAttributeEditor:
         if self.action is None:
             return
 
-        self.action.blockSignals(True)
-        self.action.setChecked(checked)
-        self.action.blockSignals(False)
+        # A plain Python flag is much cheaper than Qt's
+        # blockSignals/unblock reentrancy machinery.
+        self._suppress_toggle = True
+
+        try:
+            self.action.setChecked(checked)
+        finally:
+            self._suppress_toggle = False
+
+    def value_dialog(self, numeric):
+        """
+        Return the shared value-entry dialog, building it on first use.
+        """
+        if numeric:
+            if self._num_dialog is None:
+                self._num_dialog = _ValueDialog(
+                    self.iface.mainWindow(),
+                    numeric=True,
+                )
+
+            return self._num_dialog
+
+        if self._txt_dialog is None:
+            self._txt_dialog = _ValueDialog(
+                self.iface.mainWindow(),
+                numeric=False,
+            )
+
+        return self._txt_dialog
 
     def _update_action_text(self):
         field_text = self.target_field if self.target_field else "No field"
@@ -751,29 +1310,53 @@ class ClickAttributeEditor:
         """
         Auto-uncheck plugin action if another map tool is selected.
         """
-        if new_tool is self.tool:
+        if (
+            new_tool is self.tool
+            or self.action is None
+            or not self.action.isChecked()
+        ):
             return
 
-        if self.action and self.action.isChecked():
-            self._set_action_checked_safely(False)
-            self.prev_tool = None
+        self._set_action_checked_safely(False)
+        self.prev_tool = None
 
-            self.iface.messageBar().pushInfo(
-                "ClickAttributeEditor",
-                "Tool deactivated because another map tool was selected.",
-            )
+        # The suppressed setChecked above does not reach toggle_tool,
+        # so stop observing map-tool switches here.
+        self._disconnect_map_tool_signal()
+
+        self.iface.messageBar().pushInfo(
+            "ClickAttributeEditor",
+            "Tool deactivated because another map tool was selected.",
+        )
+
+    def _connect_map_tool_signal(self):
+        try:
+            self.iface.mapCanvas().mapToolSet.connect(self._on_map_tool_set)
+        except Exception:
+            pass
+
+    def _disconnect_map_tool_signal(self):
+        try:
+            self.iface.mapCanvas().mapToolSet.disconnect(self._on_map_tool_set)
+        except Exception:
+            pass
 
     # --------------------------
     # QGIS plugin lifecycle
     # --------------------------
 
     def initGui(self):
-        icon_path = os.path.join(os.path.dirname(__file__), ICON_FILENAME)
+        self.tool = ClickEditTool(self.iface, self)
 
-        if os.path.exists(icon_path):
-            self.icon = QIcon(icon_path)
+        # Prebuild the shared value dialogs so the first click does not
+        # pay the widget construction cost.
+        self.value_dialog(numeric=True)
+        self.value_dialog(numeric=False)
 
-        self.tool = ClickEditTool(self.iface, self)
+        self._commit_timer = QTimer(self.iface.mainWindow())
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(AUTO_COMMIT_DELAY_MS)
+        self._commit_timer.timeout.connect(self._do_commit)
 
         self.action = QAction(
             self.icon,
@@ -786,7 +1369,7 @@ class ClickAttributeEditor:
             "Click, hold and drag to bulk update features. "
             "SHIFT + right-click changes the target field."
         )
-        self.action.triggered.connect(self.toggle_tool)
+        self.action.toggled.connect(self.toggle_tool)
 
         self.iface.addToolBarIcon(self.action)
         self.iface.addPluginToMenu("ClickAttributeEditor", self.action)
@@ -800,24 +1383,67 @@ class ClickAttributeEditor:
 
         self.iface.addPluginToMenu("ClickAttributeEditor", self.action_choose)
 
+        # mapToolSet is only observed while the tool is active; see
+        # toggle_tool. An idle plugin costs nothing per tool switch.
+
+        # Defer the PNG decode off the synchronous plugin-load path;
+        # both actions share self.icon, which is filled in one event
+        # loop turn later.
+        QTimer.singleShot(0, self._deferred_icon_load)
+
         try:
-            self.iface.mapCanvas().mapToolSet.connect(self._on_map_tool_set)
+            self.iface.currentLayerChanged.connect(
+                self._on_current_layer_changed
+            )
         except Exception:
             pass
 
         layer = self.iface.activeLayer()
+        self._on_current_layer_changed(layer)
 
-        if _is_vector_layer(layer):
+        if self._active_ok:
             self.choose_field(layer)
 
         self._update_action_text()
 
+    def _deferred_icon_load(self):
+        icon_path = os.path.join(os.path.dirname(__file__), ICON_FILENAME)
+
+        try:
+            self.icon.addFile(icon_path)
+        except Exception:
+            return
+
+        for action in (self.action, self.action_choose):
+            if action is not None:
+                action.setIcon(self.icon)
+
     def unload(self):
+        if self.tool is not None:
+            try:
+                self.tool._flush_pending_edits()
+            except Exception:
+                pass
+
+        if self._commit_timer is not None:
+            try:
+                self._commit_timer.stop()
+                self._do_commit()
+            except Exception:
+                pass
+
         try:
             self.iface.mapCanvas().mapToolSet.disconnect(self._on_map_tool_set)
         except Exception:
             pass
 
+        try:
+            self.iface.currentLayerChanged.disconnect(
+                self._on_current_layer_changed
+            )
+        except Exception:
+            pass
+
         for action in (self.action, self.action_choose):
             if action:
                 try:
@@ -836,25 +1462,226 @@ class ClickAttributeEditor:
     # --------------------------
 
     def toggle_tool(self, checked):
+        if self._suppress_toggle:
+            return
+
         canvas = self.iface.mapCanvas()
 
         if checked:
             self.prev_tool = canvas.mapTool()
             canvas.setMapTool(self.tool)
+            self._connect_map_tool_signal()
 
         else:
+            self._disconnect_map_tool_signal()
+
             if self.prev_tool:
                 canvas.setMapTool(self.prev_tool)
                 self.prev_tool = None
 
+    # --------------------------
+    # Active layer
+    # --------------------------
+
+    def _on_current_layer_changed(self, layer):
+        """
+        Revalidate the active layer once per switch.
+
+        canvasReleaseEvent then only reads the cached result instead of
+        repeating the validity and type checks on every click.
+        """
+        if _is_vector_layer(layer):
+            self._active_ok = True
+            self._active_layer = layer
+            self._active_warn = None
+        else:
+            self._active_ok = False
+            self._active_layer = None
+            self._active_warn = (
+                MSG_NOT_VECTOR_LAYER if layer is not None else MSG_NO_VALID_LAYER
+            )
+
+        # Layer-keyed caches could collide if a freed layer's id() is
+        # reused; a layer switch is rare enough to just drop them.
+        self._invalidate_field_cache()
+
+        if self.tool is not None:
+            self.tool._invalidate_last_hit()
+
+    def active_vector_layer(self):
+        """
+        Return the pre-validated active vector layer, or None.
+        """
+        if not self._active_ok:
+            return None
+
+        return self._active_layer
+
+    def active_layer_warning(self):
+        return self._active_warn or MSG_NO_VALID_LAYER
+
+    # --------------------------
+    # Auto commit
+    # --------------------------
+
+    def schedule_commit(self, layer):
+        """
+        Coalesce AUTO_COMMIT provider round-trips.
+
+        A burst of edits restarts the timer; only one commit happens
+        shortly after the last edit, instead of one per click.
+        """
+        if self._commit_timer is None:
+            self._commit_layer(layer)
+            return
+
+        self._pending_commit_layer = weakref.ref(layer)
+        self._commit_timer.start()
+
+    def _do_commit(self):
+        layer_ref = self._pending_commit_layer
+        self._pending_commit_layer = None
+
+        layer = layer_ref() if layer_ref is not None else None
+
+        if layer is None:
+            return
+
+        self._commit_layer(layer)
+
+    def _commit_layer(self, layer):
+        try:
+            if not layer.isValid() or not layer.isEditable():
+                return
+
+            if not layer.commitChanges():
+                layer.rollBack()
+
+                QMessageBox.warning(
+                    self.iface.mainWindow(),
+                    "ClickAttributeEditor",
+                    "Commit failed. Changes were rolled back.",
+                )
+                return
+
+            layer.startEditing()
+
+        except Exception:
+            pass
+
+    # --------------------------
+    # Field cache
+    # --------------------------
+
+    def _field_cache_entry(self, layer, field_name):
+        """
+        Return the cached (field count, index, is numeric, field def)
+        entry for a field, populating it on a miss.
+
+        Avoids the layer.fields() / indexFromName() / isNumeric()
+        round-trips on the click hot path; the cache is invalidated
+        when the layer schema changes.
+        """
+        key = (id(layer), field_name)
+
+        fields = layer.fields()
+        field_count = fields.count()
+
+        cached = self._field_cache.get(key)
+
+        if cached is not None and cached[0] == field_count:
+            return cached
+
+        idx = fields.indexFromName(field_name)
+
+        if idx < 0:
+            return None
+
+        field_def = fields[idx]
+
+        entry = (field_count, idx, _is_numeric_field(field_def), field_def)
+        self._field_cache[key] = entry
+        self._watch_layer_fields(layer)
+
+        return entry
+
+    def field_index(self, layer, field_name):
+        """
+        Resolve a field name to its index, cached per layer.
+        """
+        entry = self._field_cache_entry(layer, field_name)
+
+        if entry is None:
+            return -1
+
+        return entry[1]
+
+    def field_is_numeric(self, layer, field_name):
+        """
+        Return whether a field is numeric, from the same cache.
+        """
+        entry = self._field_cache_entry(layer, field_name)
+
+        if entry is None:
+            return False
+
+        return entry[2]
+
+    def field_def(self, layer, field_name):
+        """
+        Return the cached QgsField definition, or None if unknown.
+        """
+        entry = self._field_cache_entry(layer, field_name)
+
+        if entry is None:
+            return None
+
+        return entry[3]
+
+    def _watch_layer_fields(self, layer):
+        try:
+            layer_key = layer.id()
+        except Exception:
+            return
+
+        if layer_key in self._field_cache_layer_ids:
+            return
+
+        try:
+            layer.updatedFields.connect(self._invalidate_field_cache)
+        except Exception:
+            return
+
+        self._field_cache_layer_ids.add(layer_key)
+
+    def _invalidate_field_cache(self):
+        self._field_cache.clear()
+        self._field_names_cache.clear()
+
+    def field_names(self, layer):
+        """
+        Return the layer's field names, cached until the schema changes.
+        """
+        fields = layer.fields()
+        key = (id(layer), fields.count())
+
+        names = self._field_names_cache.get(key)
+
+        if names is None:
+            names = [field.name() for field in fields]
+            self._field_names_cache[key] = names
+            self._watch_layer_fields(layer)
+
+        return names
+
     # --------------------------
     # Field selection
     # --------------------------
 
     def choose_field_from_active_layer(self):
-        layer = self.iface.activeLayer()
+        layer = self.active_vector_layer()
 
-        if not _is_vector_layer(layer):
+        if layer is None:
             self.iface.messageBar().pushWarning(
                 "ClickAttributeEditor",
                 "Please activate a vector layer first.",
@@ -864,7 +1691,7 @@ class ClickAttributeEditor:
         self.choose_field(layer)
 
     def choose_field(self, layer) -> bool:
-        fields = [field.name() for field in layer.fields()]
+        fields = self.field_names(layer)
 
         if not fields:
             self.iface.messageBar().pushWarning(